@@ -8,33 +8,137 @@ This is used by both the JavaScript and Python scripts to ensure consistency.
 
 import json
 import os
+import re
 import sys
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+# Try to import optional dependencies
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec.json as _msgspec_json
+except ImportError:
+    _msgspec_json = None
+
+def json_loads(buf: Union[bytes, str]):
+    """Parse JSON with the fastest available codec (orjson, msgspec, stdlib)."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    if _msgspec_json is not None:
+        return _msgspec_json.decode(buf)
+    return json.loads(buf)
+
+def json_dumps(data, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the fastest available codec."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if _msgspec_json is not None:
+        encoded = _msgspec_json.encode(data)
+        return _msgspec_json.format(encoded, indent=2) if indent else encoded
+    return json.dumps(data, indent=2 if indent else None,
+                      ensure_ascii=False).encode('utf-8')
+
+# In-process cache for the parsed categories configuration, keyed on the
+# file's mtime so edits on disk are still picked up between calls. The
+# keyword matcher (automaton or compiled alternation) is built once per
+# (re)load alongside the parsed config.
+_CONFIG_CACHE = {"mtime": None, "data": None, "automaton": None, "pattern": None}
+_CONFIG_LOCK = threading.Lock()
+
+def _build_keyword_pattern(config: Dict) -> tuple:
+    """
+    Build a single compiled alternation over all category keywords
+
+    Used when pyahocorasick is unavailable: one finditer pass replaces the
+    per-keyword substring scans. The lookahead keeps overlapping matches,
+    and longer keywords are listed first so they win at a given position.
+
+    Returns:
+        tuple: (compiled pattern, lowered keyword -> category id dict)
+    """
+    keyword_to_category = {}
+    for category in config["categories"]:
+        for keyword in category["keywords"]:
+            keyword_to_category.setdefault(keyword.lower(), category["id"])
+
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(keyword_to_category, key=len, reverse=True)
+    )
+    pattern = re.compile(f"(?=({alternation}))")
+    return pattern, keyword_to_category
+
+def _build_keyword_automaton(config: Dict) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton over all category keywords
+
+    This lets detect_categories find every keyword match in a single linear
+    pass over the text instead of one substring scan per keyword. Returns
+    None when pyahocorasick is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for category in config["categories"]:
+        for keyword in category["keywords"]:
+            automaton.add_word(keyword.lower(), category["id"])
+    automaton.make_automaton()
+    return automaton
+
 # Get the root directory of the project
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the root directory of the project."""
+    """Get the root directory of the project (computed once per process)."""
     current_dir = Path(os.path.dirname(os.path.abspath(__file__)))
     return current_dir.parent.parent
 
 def load_categories_config() -> Dict:
     """
     Load the categories from the central configuration file
-    
+
+    The parsed configuration is cached in-process and only re-read when the
+    file's modification time changes, so repeated callers (e.g. category
+    detection over many PDF entries) don't re-parse the JSON every time.
+
     Returns:
         Dict: The categories configuration
     """
     config_path = get_project_root() / 'config' / 'categories.json'
-    
+
     try:
         if not config_path.exists():
             print(f"Error: Categories configuration file not found at {config_path}")
             return create_default_config()
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+
+        with _CONFIG_LOCK:
+            mtime = config_path.stat().st_mtime_ns
+            if mtime == _CONFIG_CACHE["mtime"]:
+                return _CONFIG_CACHE["data"]
+
+            with open(config_path, 'rb') as f:
+                config = json_loads(f.read())
+
+            _CONFIG_CACHE["mtime"] = mtime
+            _CONFIG_CACHE["data"] = config
+            _CONFIG_CACHE["automaton"] = _build_keyword_automaton(config)
+            _CONFIG_CACHE["pattern"] = (
+                None if _CONFIG_CACHE["automaton"] is not None
+                else _build_keyword_pattern(config)
+            )
+            return config
     except Exception as e:
         print(f"Error loading categories configuration: {str(e)}")
         return create_default_config()
@@ -86,9 +190,16 @@ def update_categories_config(config: Dict) -> bool:
         config["lastUpdated"] = datetime.now().isoformat()
         
         # Write the file
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
-        
+        with open(config_path, 'wb') as f:
+            f.write(json_dumps(config))
+
+        # Invalidate the cache so the next load picks up the new file
+        with _CONFIG_LOCK:
+            _CONFIG_CACHE["mtime"] = None
+            _CONFIG_CACHE["data"] = None
+            _CONFIG_CACHE["automaton"] = None
+            _CONFIG_CACHE["pattern"] = None
+
         return True
     except Exception as e:
         print(f"Error updating categories configuration: {str(e)}")
@@ -106,15 +217,40 @@ def detect_categories(text: str) -> List[str]:
     """
     config = load_categories_config()
     text_lower = text.lower()
+    total_categories = len(config["categories"])
+
+    # One pass over the text with the prebuilt automaton when available.
+    # Either way the scan itself runs in C (the pyahocorasick extension or
+    # the re engine); once every category has matched there is nothing left
+    # to find, so bail out early on very long texts.
+    automaton = _CONFIG_CACHE["automaton"] if _CONFIG_CACHE["data"] is config else None
+    if automaton is not None:
+        matches = []
+        seen = set()
+        for _, category_id in automaton.iter(text_lower):
+            if category_id not in seen:
+                seen.add(category_id)
+                matches.append(category_id)
+                if len(matches) == total_categories:
+                    break
+        return matches
+
+    # Without pyahocorasick, use the precompiled keyword alternation
+    if _CONFIG_CACHE["data"] is config:
+        pattern, keyword_to_category = _CONFIG_CACHE["pattern"]
+    else:
+        pattern, keyword_to_category = _build_keyword_pattern(config)
+
     matches = []
-    
-    for category in config["categories"]:
-        for keyword in category["keywords"]:
-            if keyword.lower() in text_lower:
-                if category["id"] not in matches:
-                    matches.append(category["id"])
+    seen = set()
+    for match in pattern.finditer(text_lower):
+        category_id = keyword_to_category[match.group(1)]
+        if category_id not in seen:
+            seen.add(category_id)
+            matches.append(category_id)
+            if len(matches) == total_categories:
                 break
-    
+
     return matches
 
 def generate_search_queries(category_id: str) -> List[str]:
@@ -155,39 +291,48 @@ def get_category_by_id(category_id: str) -> Optional[Dict]:
     config = load_categories_config()
     return next((cat for cat in config["categories"] if cat["id"] == category_id), None)
 
-def ensure_json_schema_compatibility(pdf_entry: Dict) -> Dict:
+# Required fields with static default values; list defaults are copied per
+# entry, and the date fields below are filled in with the current day
+_SCHEMA_STATIC = {
+    "id": None,  # Should be provided
+    "url": None,  # Should be provided
+    "title": "Untitled PDF",
+    "author": "Unknown",
+    "categories": [],
+    "source": "unknown",
+    "yearPublished": None,
+    "tags": [],
+    "isAvailable": True,
+    "lastStatus": 200,
+    "pages": None,
+    "sizeMB": None
+}
+_SCHEMA_DATE_FIELDS = ("dateAdded", "lastChecked")
+_ALLOWED_FIELDS = frozenset(_SCHEMA_STATIC) | frozenset(_SCHEMA_DATE_FIELDS)
+
+def ensure_json_schema_compatibility(pdf_entry: Dict, today: Optional[str] = None) -> Dict:
     """
     Ensure a PDF entry conforms to the JavaScript schema
-    
+
     Args:
         pdf_entry: The PDF entry to normalize
-        
+        today: Today's date as YYYY-MM-DD; callers normalizing a batch can
+               pass a shared value to avoid repeated datetime.now() calls
+
     Returns:
         Dict: The normalized PDF entry
     """
-    # Required fields with default values
-    schema_fields = {
-        "id": None,  # Should be provided
-        "url": None,  # Should be provided
-        "title": "Untitled PDF",
-        "author": "Unknown",
-        "categories": [],
-        "source": "unknown",
-        "yearPublished": None,
-        "tags": [],
-        "isAvailable": True,
-        "dateAdded": datetime.now().strftime("%Y-%m-%d"),
-        "lastChecked": datetime.now().strftime("%Y-%m-%d"),
-        "lastStatus": 200,
-        "pages": None,
-        "sizeMB": None
-    }
-    
     # Apply defaults for missing fields
-    for field, default_value in schema_fields.items():
+    for field, default_value in _SCHEMA_STATIC.items():
         if field not in pdf_entry:
-            pdf_entry[field] = default_value
-    
+            pdf_entry[field] = [] if isinstance(default_value, list) else default_value
+
+    if today is None:
+        today = datetime.now().strftime("%Y-%m-%d")
+    for field in _SCHEMA_DATE_FIELDS:
+        if field not in pdf_entry:
+            pdf_entry[field] = today
+
     # Ensure arrays are arrays
     for field in ["categories", "tags"]:
         if not isinstance(pdf_entry[field], list):
@@ -195,15 +340,34 @@ def ensure_json_schema_compatibility(pdf_entry: Dict) -> Dict:
                 pdf_entry[field] = [pdf_entry[field]]
             else:
                 pdf_entry[field] = []
-    
+
     # Remove non-standard fields
-    allowed_fields = set(schema_fields.keys())
-    for field in list(pdf_entry.keys()):
-        if field not in allowed_fields:
-            del pdf_entry[field]
-    
+    for field in pdf_entry.keys() - _ALLOWED_FIELDS:
+        del pdf_entry[field]
+
     return pdf_entry
 
+def ensure_json_schema_compatibility_batch(pdf_entries: List[Dict],
+                                           today: Optional[str] = None) -> List[Dict]:
+    """
+    Normalize a batch of PDF entries against the JavaScript schema
+
+    One call replaces a per-entry loop at the call site, and the shared
+    date value is computed once for the whole batch.
+
+    Args:
+        pdf_entries: The PDF entries to normalize
+        today: Today's date as YYYY-MM-DD; computed once when omitted
+
+    Returns:
+        List[Dict]: The normalized entries (the same list, updated in place)
+    """
+    if today is None:
+        today = datetime.now().strftime("%Y-%m-%d")
+    for i, pdf_entry in enumerate(pdf_entries):
+        pdf_entries[i] = ensure_json_schema_compatibility(pdf_entry, today=today)
+    return pdf_entries
+
 # Direct command line usage to update search queries
 if __name__ == "__main__":
     config = load_categories_config()
@@ -16,33 +16,55 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
+import importlib
+import io
 import json
 import os
 import random
 import re
+import threading
 import time
 import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
-# Try to import optional dependencies
 try:
-    from googlesearch import search
-    GOOGLE_SEARCH_AVAILABLE = True
+    import orjson
 except ImportError:
-    GOOGLE_SEARCH_AVAILABLE = False
-    print("Warning: googlesearch-python not available. Google search method will be disabled.")
+    orjson = None
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-    print("Warning: pdfplumber not available. PDF metadata extraction will be limited.")
+def _json_loads(buf):
+    """Parse JSON with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+def _json_dumps(data, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None,
+                      ensure_ascii=False).encode('utf-8')
+
+# Optional dependencies (googlesearch, pypdf, pdfplumber) are imported
+# lazily on first use so short runs and --help don't pay their import cost
+@functools.cache
+def _optional_import(name: str):
+    """Import an optional module on first use, returning None if missing."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
 # Constants
 USER_AGENTS = [
@@ -56,6 +78,50 @@ USER_AGENTS = [
 MIN_DELAY = 2
 MAX_DELAY = 5
 
+# Number of concurrent workers used to validate PDF URLs
+VALIDATION_WORKERS = 8
+
+# Minimum spacing between validation requests to the same host (in seconds)
+PER_HOST_DELAY = 1.0
+
+# Minimum spacing between consecutive searches per method (in seconds).
+# Each engine rate-limits independently, so spacing is enforced per method
+# rather than with one global delay; Google is the quickest to block.
+SEARCH_METHOD_INTERVALS = {
+    'google': 10.0,
+    'duckduckgo': 5.0,
+    'website': 1.0,
+}
+
+# Size of the PDF sample downloaded for verification (100KB)
+SAMPLE_BYTES = 100 * 1024
+
+# Save the aggregated results after this many newly validated PDFs so long
+# runs checkpoint their progress
+CHECKPOINT_EVERY = 25
+
+# Strips the .pdf extension and word separators out of a filename in one pass
+# when deriving a fallback title from the URL
+_TITLE_CLEAN = re.compile(r'\.pdf$|[-_]', re.IGNORECASE)
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection.
+
+    Lowercases the scheme and host, strips default ports and fragments, and
+    percent-encodes the path consistently, so trivially different spellings
+    of the same address don't get validated twice.
+    """
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if scheme == 'http' and netloc.endswith(':80'):
+        netloc = netloc[:-3]
+    elif scheme == 'https' and netloc.endswith(':443'):
+        netloc = netloc[:-4]
+    path = urllib.parse.quote(urllib.parse.unquote(parts.path))
+    return urllib.parse.urlunsplit((scheme, netloc, path, parts.query, ''))
+
 class PDFFinder:
     """A class to find PDF files on the web using various search methods."""
     
@@ -72,22 +138,120 @@ class PDFFinder:
         self.output_file = output_file
         self.verbose = verbose
         self.session = requests.Session()
-        
+
+        # Pool connections so concurrent validations reuse TCP/TLS sessions
+        # instead of renegotiating per request, and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3,
+                              status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['User-Agent'] = self._get_random_user_agent()
+
+
         # Load existing data if provided
         if existing_file and os.path.exists(existing_file):
-            with open(existing_file, 'r', encoding='utf-8') as f:
-                try:
-                    self.data = json.load(f)
-                    if self.verbose:
-                        print(f"Loaded {len(self.data['pdfs'])} existing PDF entries.")
-                except json.JSONDecodeError:
-                    self.data = {"lastValidated": datetime.now().isoformat(), "pdfs": []}
+            self.data = self._load_existing_data(existing_file)
+            if self.verbose:
+                print(f"Loaded {len(self.data['pdfs'])} existing PDF entries.")
         else:
             self.data = {"lastValidated": datetime.now().isoformat(), "pdfs": []}
             
-        # Create a set of existing URLs for quick lookup
-        self.existing_urls = {pdf['url'] for pdf in self.data['pdfs']}
-    
+        # Create a set of existing URLs (normalized) for quick lookup
+        self.existing_urls = {normalize_url(pdf['url']) for pdf in self.data['pdfs']}
+
+        # Fold in any entries journaled by an interrupted previous run
+        self._recover_journal()
+
+        # Newly validated PDFs since the last save, for checkpointing
+        self._since_checkpoint = 0
+
+        # When False, search_and_process skips its checkpoint and final
+        # saves; see defer_saves()
+        self._autosave = True
+
+        # Per-host request spacing state: host -> [lock, last request time]
+        self._host_throttle = {}
+        # Per-method search spacing state, same shape keyed by method name
+        self._method_throttle = {}
+        self._throttle_lock = threading.Lock()
+
+        # Serializes mutation of the shared collection state when several
+        # search_and_process calls run concurrently; reentrant so checkpoint
+        # saves inside the guarded block can re-acquire it
+        self._data_lock = threading.RLock()
+
+    def _load_existing_data(self, existing_file: str) -> Dict:
+        """
+        Load an existing archive from disk.
+
+        When json-stream is installed the PDF entries are materialized one at
+        a time straight off the file, so startup never holds the raw file
+        text and a full parse tree in memory at once - noticeable once the
+        archive grows to many MB. Falls back to a plain full-file parse.
+        """
+        empty = {"lastValidated": datetime.now().isoformat(), "pdfs": []}
+        json_stream = _optional_import('json_stream')
+
+        try:
+            with open(existing_file, 'rb') as f:
+                if json_stream is None:
+                    return _json_loads(f.read())
+
+                data = dict(empty)
+                for key, value in json_stream.load(f).items():
+                    if key == 'pdfs':
+                        data['pdfs'] = [json_stream.to_standard_types(pdf)
+                                        for pdf in value]
+                    else:
+                        data[key] = json_stream.to_standard_types(value)
+                return data
+        except ValueError:
+            return empty
+
+    def _journal_path(self) -> str:
+        """Return the path of the append-only journal next to the output file."""
+        return self.output_file + '.jsonl'
+
+    def _append_to_journal(self, entry: Dict) -> None:
+        """
+        Append a single validated entry to the journal file.
+
+        Each entry is one JSON line written as soon as it is validated, so an
+        interrupted run never loses work and the cost per entry stays constant
+        instead of rewriting the whole aggregated file.
+        """
+        with open(self._journal_path(), 'ab') as f:
+            f.write(_json_dumps(entry, indent=False) + b'\n')
+
+    def _recover_journal(self) -> None:
+        """Load journaled entries from an interrupted run into the collection."""
+        journal_path = self._journal_path()
+        if not os.path.exists(journal_path):
+            return
+
+        recovered = 0
+        with open(journal_path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-write
+                    continue
+                if entry.get('url') and normalize_url(entry['url']) not in self.existing_urls:
+                    self.data['pdfs'].append(entry)
+                    self.existing_urls.add(normalize_url(entry['url']))
+                    recovered += 1
+
+        if recovered and self.verbose:
+            print(f"Recovered {recovered} PDF entries from journal {journal_path}")
+
     def _get_random_user_agent(self) -> str:
         """Return a random user agent from the list."""
         return random.choice(USER_AGENTS)
@@ -108,11 +272,12 @@ class PDFFinder:
         Returns:
             List of URLs that might be PDFs
         """
-        if not GOOGLE_SEARCH_AVAILABLE:
+        googlesearch = _optional_import('googlesearch')
+        if googlesearch is None:
             if self.verbose:
                 print("Google search method not available. Install googlesearch-python package.")
             return []
-            
+
         # Add 'filetype:pdf' to the query if not already present
         if 'filetype:pdf' not in query.lower():
             query = f"{query} filetype:pdf"
@@ -120,7 +285,7 @@ class PDFFinder:
         results = []
         try:
             # The search function yields URLs one at a time
-            for url in search(query, num_results=limit, lang="en"):
+            for url in googlesearch.search(query, num_results=limit, lang="en"):
                 if url.lower().endswith('.pdf'):
                     results.append(url)
                     
@@ -197,21 +362,22 @@ class PDFFinder:
         Returns:
             List of PDF URLs found on the website
         """
-        headers = {'User-Agent': self._get_random_user_agent()}
         results = []
+        found = set()
         visited = set()
-        to_visit = [website_url]
-        
+        to_visit = deque([website_url])
+        queued = {website_url}
+
         # Basic crawler that looks for PDF links
         while to_visit and len(results) < limit:
-            current_url = to_visit.pop(0)
+            current_url = to_visit.popleft()
             if current_url in visited:
                 continue
                 
             visited.add(current_url)
             
             try:
-                response = self.session.get(current_url, headers=headers, timeout=10)
+                response = self.session.get(current_url, timeout=10)
                 if response.status_code != 200:
                     continue
                     
@@ -221,26 +387,32 @@ class PDFFinder:
                     continue
                     
                 soup = BeautifulSoup(response.text, 'html.parser')
-                
+
+                # The page's own host, computed once for all of its links
+                current_netloc = urllib.parse.urlparse(current_url).netloc
+
                 # Find PDF links
                 for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    
-                    # Handle relative URLs
-                    if href.startswith('/'):
-                        href = urllib.parse.urljoin(current_url, href)
-                    
+                    # Resolve every href against the page URL so relative,
+                    # protocol-relative and query-only links normalize to the
+                    # same absolute form, and drop fragments so in-page
+                    # anchors don't slip past the dedup sets
+                    href = urllib.parse.urljoin(current_url, link['href']).split('#', 1)[0]
+
+
                     # Check if it's a PDF
                     if href.lower().endswith('.pdf'):
-                        if href not in results:
+                        if href not in found:
+                            found.add(href)
                             results.append(href)
                             if len(results) >= limit:
                                 break
-                    
+
                     # Add more links to explore (but stay on the same domain)
-                    if (len(to_visit) < 50 and href not in visited and href not in to_visit and
-                            urllib.parse.urlparse(current_url).netloc == urllib.parse.urlparse(href).netloc):
+                    if (len(to_visit) < 50 and href not in visited and href not in queued and
+                            urllib.parse.urlparse(href).netloc == current_netloc):
                         to_visit.append(href)
+                        queued.add(href)
                         
                 # Respect the website by not hammering it with requests
                 self._introduce_delay()
@@ -251,6 +423,125 @@ class PDFFinder:
         
         return results
     
+    def _extract_metadata_pypdf(self, sample: bytes, metadata: Dict) -> None:
+        """
+        Extract metadata from a PDF sample with pypdf.
+
+        pypdf only reads the trailer and /Info dictionary for this, which is
+        far cheaper than building pdfplumber's full page model. The page
+        count is only trusted when the sample contains the EOF marker, i.e.
+        the whole document fit in the sample.
+        """
+        pypdf = _optional_import('pypdf')
+        try:
+            reader = pypdf.PdfReader(io.BytesIO(sample), strict=False)
+            info = reader.metadata
+            if info:
+                if info.title:
+                    metadata['title'] = info.title
+                if info.author:
+                    metadata['author'] = info.author
+                date_str = info.get('/CreationDate')
+                if date_str and str(date_str).startswith('D:'):
+                    metadata['yearPublished'] = str(date_str)[2:6]
+
+            if b'%%EOF' in sample:
+                metadata['pages'] = len(reader.pages)
+        except Exception as e:
+            if self.verbose:
+                print(f"Error extracting PDF metadata: {e}")
+
+    def _extract_metadata_pdfplumber(self, sample: bytes, metadata: Dict,
+                                     url_title: str) -> None:
+        """Extract metadata from a PDF sample with pdfplumber (fallback)."""
+        pdfplumber = _optional_import('pdfplumber')
+        try:
+            with pdfplumber.open(io.BytesIO(sample)) as pdf:
+                if hasattr(pdf, 'metadata') and pdf.metadata:
+                    if pdf.metadata.get('Title'):
+                        metadata['title'] = pdf.metadata.get('Title')
+                    if pdf.metadata.get('Author'):
+                        metadata['author'] = pdf.metadata.get('Author')
+                    if pdf.metadata.get('CreationDate'):
+                        # Try to parse PDF creation date
+                        date_str = pdf.metadata.get('CreationDate')
+                        if date_str and date_str.startswith('D:'):
+                            # Basic conversion of PDF date format
+                            date_str = date_str[2:10]  # Extract YYYYMMDD
+                            try:
+                                year = date_str[:4]
+                                metadata['yearPublished'] = year
+                            except:
+                                pass
+
+                # Get page count
+                metadata['pages'] = len(pdf.pages)
+
+                # Get text from first page for better title
+                if 'title' not in metadata or metadata['title'] == url_title:
+                    try:
+                        first_page = pdf.pages[0]
+                        text = first_page.extract_text()
+                        if text:
+                            # Try to extract a title from the first few lines
+                            lines = text.split('|')
+                            for line in lines[:5]:  # Check first 5 lines
+                                line = line.strip()
+                                if 10 < len(line) < 100:  # Reasonable title length
+                                    metadata['title'] = line
+                                    break
+                    except:
+                        pass
+        except Exception as e:
+            if self.verbose:
+                print(f"Error extracting PDF metadata: {e}")
+
+    def _throttle_host(self, url: str) -> None:
+        """
+        Space out requests per host instead of sleeping globally.
+
+        Workers validating URLs on different hosts proceed in parallel;
+        consecutive requests to the same host wait until at least
+        PER_HOST_DELAY seconds have passed since the previous one.
+        """
+        host = urllib.parse.urlparse(url).netloc
+        with self._throttle_lock:
+            entry = self._host_throttle.setdefault(host, [threading.Lock(), 0.0])
+
+        with entry[0]:
+            wait = PER_HOST_DELAY - (time.monotonic() - entry[1])
+            if wait > 0:
+                time.sleep(wait)
+            entry[1] = time.monotonic()
+
+    def _throttle_method(self, method: str) -> None:
+        """
+        Space out consecutive searches against the same engine.
+
+        Mirrors _throttle_host: concurrent queries targeting different
+        methods proceed independently, while back-to-back searches on one
+        engine wait out that engine's minimum interval. Replaces the old
+        one-size-fits-all sleep between queries, which throttled DuckDuckGo
+        and website crawls to Google's pace for no benefit.
+        """
+        interval = SEARCH_METHOD_INTERVALS.get(method)
+        if not interval:
+            return
+
+        with self._throttle_lock:
+            entry = self._method_throttle.setdefault(method, [threading.Lock(), 0.0])
+
+        with entry[0]:
+            wait = interval - (time.monotonic() - entry[1])
+            if wait > 0:
+                time.sleep(wait)
+            entry[1] = time.monotonic()
+
+    def _validate_with_delay(self, url: str, verify: bool) -> Tuple[bool, Dict[str, Union[str, int]]]:
+        """Validate a URL once its host is clear of the per-host spacing."""
+        self._throttle_host(url)
+        return self.validate_pdf_url(url, verify=verify)
+
     def validate_pdf_url(self, url: str, verify: bool = True) -> Tuple[bool, Dict[str, Union[str, int]]]:
         """
         Validate that a URL actually points to a PDF and get basic metadata.
@@ -262,109 +553,76 @@ class PDFFinder:
         Returns:
             Tuple of (is_valid, metadata_dict)
         """
-        headers = {'User-Agent': self._get_random_user_agent()}
         metadata = {}
-        
+
         try:
-            # Make a HEAD request first to check content type and size
-            head_response = self.session.head(url, headers=headers, timeout=10, allow_redirects=True)
-            
-            content_type = head_response.headers.get('Content-Type', '').lower()
+            if verify:
+                # One ranged GET gets us the headers and a 100KB sample in a
+                # single round trip; servers that ignore Range just send more,
+                # which we truncate while streaming.
+                headers = {'Range': f'bytes=0-{SAMPLE_BYTES - 1}'}
+                with self.session.get(url, headers=headers, stream=True, timeout=15,
+                                      allow_redirects=True) as response:
+                    if response.status_code not in (200, 206):
+                        return False, {}
+                    response_headers = response.headers
+                    sample = b''
+                    for chunk in response.iter_content(chunk_size=65536):
+                        sample += chunk
+                        if len(sample) >= SAMPLE_BYTES:
+                            break
+                    sample = sample[:SAMPLE_BYTES]
+            else:
+                # A HEAD request is enough when no content check is wanted
+                head_response = self.session.head(url, timeout=10, allow_redirects=True)
+                response_headers = head_response.headers
+                sample = b''
+
+            content_type = response_headers.get('Content-Type', '').lower()
             if 'application/pdf' not in content_type and not url.lower().endswith('.pdf'):
                 if self.verbose:
                     print(f"Skipping non-PDF content type: {content_type} for {url}")
                 return False, {}
-                
-            # Get content length if available
-            content_length = head_response.headers.get('Content-Length')
+
+            # Get the total size if available; for a 206 response the
+            # Content-Range header carries it, otherwise Content-Length does
+            content_length = response_headers.get('Content-Length')
+            content_range = response_headers.get('Content-Range', '')
+            if '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+                content_length = content_range.rsplit('/', 1)[1]
             if content_length:
                 # Convert to MB for readability
                 size_mb = round(int(content_length) / (1024 * 1024), 2)
                 metadata['sizeMB'] = size_mb
-                
+
                 # Skip very large PDFs
                 if size_mb > 50:  # Adjust this threshold as needed
                     if self.verbose:
                         print(f"Skipping large PDF ({size_mb} MB): {url}")
                     return False, {}
-            
+
             # Get the PDF title from the URL if we can't extract it
             filename = os.path.basename(urllib.parse.urlparse(url).path)
-            title = filename.replace('.pdf', '').replace('-', ' ').replace('_', ' ').replace('%20', ' ')
+            title = _TITLE_CLEAN.sub(' ', urllib.parse.unquote(filename))
             title = ' '.join(w.capitalize() if w.islower() else w for w in title.split())
             metadata['title'] = title
-            
+
             # Skip deep verification if not requested
             if not verify:
                 return True, metadata
-            
-            # Try to get more metadata if pdfplumber is available
-            if PDFPLUMBER_AVAILABLE:
-                # Download a small chunk of the PDF to extract metadata
-                with self.session.get(url, headers=headers, stream=True, timeout=15) as response:
-                    if response.status_code == 200:
-                        # Download only the first 100KB to check
-                        chunk_size = 1024  # 1KB
-                        max_chunks = 100   # 100KB max
-                        
-                        chunks = []
-                        for i, chunk in enumerate(response.iter_content(chunk_size=chunk_size)):
-                            if i >= max_chunks:
-                                break
-                            chunks.append(chunk)
-                        
-                        # Save to a temporary file
-                        temp_file = f'temp_pdf_download_{random.randint(1000, 9999)}.pdf'
-                        with open(temp_file, 'wb') as f:
-                            for chunk in chunks:
-                                f.write(chunk)
-                        
-                        try:
-                            # Extract metadata from the PDF
-                            with pdfplumber.open(temp_file) as pdf:
-                                if hasattr(pdf, 'metadata') and pdf.metadata:
-                                    if pdf.metadata.get('Title'):
-                                        metadata['title'] = pdf.metadata.get('Title')
-                                    if pdf.metadata.get('Author'):
-                                        metadata['author'] = pdf.metadata.get('Author')
-                                    if pdf.metadata.get('CreationDate'):
-                                        # Try to parse PDF creation date
-                                        date_str = pdf.metadata.get('CreationDate')
-                                        if date_str and date_str.startswith('D:'):
-                                            # Basic conversion of PDF date format
-                                            date_str = date_str[2:10]  # Extract YYYYMMDD
-                                            try:
-                                                year = date_str[:4]
-                                                metadata['yearPublished'] = year
-                                            except:
-                                                pass
-                                
-                                # Get page count
-                                metadata['pages'] = len(pdf.pages)
-                                
-                                # Get text from first page for better title
-                                if 'title' not in metadata or metadata['title'] == title:
-                                    try:
-                                        first_page = pdf.pages[0]
-                                        text = first_page.extract_text()
-                                        if text:
-                                            # Try to extract a title from the first few lines
-                                            lines = text.split('|')
-                                            for line in lines[:5]:  # Check first 5 lines
-                                                line = line.strip()
-                                                if 10 < len(line) < 100:  # Reasonable title length
-                                                    metadata['title'] = line
-                                                    break
-                                    except:
-                                        pass
-                        except Exception as e:
-                            if self.verbose:
-                                print(f"Error extracting PDF metadata: {e}")
-                        finally:
-                            # Clean up temp file
-                            if os.path.exists(temp_file):
-                                os.remove(temp_file)
-            
+
+            # Try to extract more metadata from the sample; only parse
+            # samples that actually start with the PDF magic bytes
+            if sample.startswith(b'%PDF'):
+                if _optional_import('pypdf') is not None:
+                    self._extract_metadata_pypdf(sample, metadata)
+                elif _optional_import('pdfplumber') is not None:
+                    self._extract_metadata_pdfplumber(sample, metadata, title)
+                elif self.verbose:
+                    print("Warning: neither pypdf nor pdfplumber available. "
+                          "PDF metadata extraction will be limited.")
+
+
             # Clean up title if needed
             if 'title' in metadata:
                 # Remove excessive whitespace and newlines
@@ -400,49 +658,70 @@ class PDFFinder:
             
         all_urls = []
         
-        # Collect URLs from all specified search methods
+        # Collect URLs from all specified search methods, waiting out each
+        # method's own minimum interval first so concurrent queries don't
+        # hammer a single engine
         for method in search_methods:
             if method == 'google':
+                self._throttle_method(method)
                 if self.verbose:
                     print(f"Searching Google for: {query}")
                 urls = self.search_using_google(query, limit)
                 all_urls.extend(urls)
             elif method == 'duckduckgo':
+                self._throttle_method(method)
                 if self.verbose:
                     print(f"Searching DuckDuckGo for: {query}")
                 urls = self.search_using_duckduckgo(query, limit)
                 all_urls.extend(urls)
             elif method == 'website':
+                self._throttle_method(method)
                 if self.verbose:
                     print(f"Crawling website: {query}")
                 urls = self.search_website_for_pdfs(query, limit)
                 all_urls.extend(urls)
         
-        # Remove duplicates while preserving order
+        # Remove duplicates (by normalized form) while preserving order
         unique_urls = []
         seen = set()
-        for url in all_urls:
-            if url not in seen and url not in self.existing_urls:
-                seen.add(url)
-                unique_urls.append(url)
+        with self._data_lock:
+            for url in all_urls:
+                normalized = normalize_url(url)
+                if normalized not in seen and normalized not in self.existing_urls:
+                    seen.add(normalized)
+                    unique_urls.append(url)
                 
         if self.verbose:
             print(f"Found {len(unique_urls)} unique new PDF URLs")
             
-        # Validate and process each URL
+        # Validate the URLs concurrently - each validation is an independent,
+        # network-bound HEAD + sample download, so threads overlap the latency.
+        # All mutation of shared state happens on this thread as futures finish.
         results = []
-        for url in tqdm(unique_urls, desc="Validating PDFs", disable=not self.verbose):
-            is_valid, metadata = self.validate_pdf_url(url, verify=verify)
-            if is_valid:
-                # Generate a unique ID
-                pdf_id = f"pdf{abs(hash(url)) % 10000000:07d}"
+        today = datetime.now().strftime("%Y-%m-%d")
+        with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+            future_to_url = {
+                executor.submit(self._validate_with_delay, url, verify): url
+                for url in unique_urls
+            }
+            for future in tqdm(as_completed(future_to_url), total=len(future_to_url),
+                               desc="Validating PDFs", disable=not self.verbose):
+                url = future_to_url[future]
+                is_valid, metadata = future.result()
+                if not is_valid:
+                    continue
+                # Generate a unique ID from the normalized URL; BLAKE2b is
+                # stable across processes, unlike Python's randomized hash()
+                digest = hashlib.blake2b(normalize_url(url).encode('utf-8'),
+                                         digest_size=6).hexdigest()
+                pdf_id = f"pdf{digest}"
                 
                 pdf_entry = {
                     "id": pdf_id,
                     "url": url,
                     "title": metadata.get('title', "Untitled PDF"),
-                    "dateAdded": datetime.now().strftime("%Y-%m-%d"),
-                    "lastChecked": datetime.now().strftime("%Y-%m-%d"),
+                    "dateAdded": today,
+                    "lastChecked": today,
                     "isAvailable": True,
                     "lastStatus": 200
                 }
@@ -458,33 +737,76 @@ class PDFFinder:
                     pdf_entry["yearPublished"] = metadata['yearPublished']
                 if len(query) > 0:
                     pdf_entry["sourceQuery"] = query.split(" ")
-                
-                results.append(pdf_entry)
-                self.data['pdfs'].append(pdf_entry)
-                
-                # Update our set of URLs to avoid duplicates
-                self.existing_urls.add(url)
-            
-            # Short delay between validations
-            time.sleep(random.uniform(0.5, 1.5))
-            
+
+                # All shared-state mutation happens under the data lock, and
+                # the URL is re-checked there in case a concurrent call
+                # validated the same PDF after this one deduplicated
+                normalized = normalize_url(url)
+                with self._data_lock:
+                    if normalized in self.existing_urls:
+                        continue
+                    results.append(pdf_entry)
+                    self.data['pdfs'].append(pdf_entry)
+                    self._append_to_journal(pdf_entry)
+
+                    # Update our set of URLs to avoid duplicates
+                    self.existing_urls.add(normalized)
+
+                    # Checkpoint periodically so long runs don't ride on the
+                    # journal alone
+                    self._since_checkpoint += 1
+                    if self._autosave and self._since_checkpoint >= CHECKPOINT_EVERY:
+                        self.save_results()
+
         # Save results to the output file
-        self.save_results()
-        
+        if self._autosave:
+            self.save_results()
+
         return results
     
+    @contextmanager
+    def defer_saves(self):
+        """
+        Suspend automatic saves for the duration of the block.
+
+        Callers issuing many search_and_process calls in a row (the
+        all-categories update) would otherwise rewrite the whole aggregated
+        file after every query. Inside the block only the per-entry journal
+        is written, which keeps crash safety, and a single save flushes
+        everything when the block exits.
+        """
+        self._autosave = False
+        try:
+            yield self
+        finally:
+            self._autosave = True
+            if self._since_checkpoint:
+                self.save_results()
+
     def save_results(self) -> None:
-        """Save the current results to the output file."""
-        self.data["lastValidated"] = datetime.now().isoformat()
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(self.output_file)), exist_ok=True)
-        
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
-            
-        if self.verbose:
-            print(f"Saved {len(self.data['pdfs'])} PDF entries to {self.output_file}")
+        """Save the current results to the output file atomically."""
+        with self._data_lock:
+            self.data["lastValidated"] = datetime.now().isoformat()
+
+            # Ensure directory exists
+            os.makedirs(os.path.dirname(os.path.abspath(self.output_file)), exist_ok=True)
+
+            # Write to a sibling temp file and rename over the output so a
+            # crash mid-write can never leave a truncated archive behind
+            tmp_file = self.output_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(self.data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.output_file)
+
+            # Everything in the journal is now in the aggregated file
+            if os.path.exists(self._journal_path()):
+                os.remove(self._journal_path())
+            self._since_checkpoint = 0
+
+            if self.verbose:
+                print(f"Saved {len(self.data['pdfs'])} PDF entries to {self.output_file}")
 
 def main():
     """Main function to run the PDF finder from command line."""
@@ -5,139 +5,237 @@ Sync Categories
 This script synchronizes Python scripts with the centralized category configuration.
 """
 
-import json
+import mmap
 import os
 import sys
 from pathlib import Path
 
 # Import our category utilities
 try:
-    from category_utils import load_categories_config, get_project_root
+    from category_utils import (load_categories_config, detect_categories,
+                                get_project_root, json_loads, json_dumps)
 except ImportError:
     # Try to find the module in the same directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     if os.path.exists(os.path.join(script_dir, 'category_utils.py')):
         sys.path.append(script_dir)
-        from category_utils import load_categories_config, get_project_root
+        from category_utils import (load_categories_config, detect_categories,
+                                    get_project_root, json_loads, json_dumps)
     else:
         print("Error: Could not import category_utils.py. Make sure it's in the same directory.")
         sys.exit(1)
 
-def update_pdf_data_metadata(config):
-    """Update the metadata section in pdf-data.json"""
-    data_file_path = get_project_root() / 'public' / 'data' / 'pdf-data.json'
-    
-    if not data_file_path.exists():
-        print(f"✗ Error: pdf-data.json not found at {data_file_path}")
-        return False
-    
-    try:
-        # Read the data file
-        with open(data_file_path, 'r', encoding='utf-8') as f:
-            pdf_data = json.load(f)
-        
-        # Update the metadata section
-        if 'metadata' not in pdf_data:
-            pdf_data['metadata'] = {}
-        
-        # Update categories in metadata
-        pdf_data['metadata']['categories'] = [
-            {
-                "id": cat["id"],
-                "name": cat["name"],
-                "color": cat["color"]
-            }
-            for cat in config["categories"]
-        ]
-        
-        # Ensure version is set
-        pdf_data['metadata']['version'] = pdf_data['metadata'].get('version', '2.0')
-        
-        # Write the updated file
-        with open(data_file_path, 'w', encoding='utf-8') as f:
-            json.dump(pdf_data, f, indent=2)
-        
-        print('✓ Updated pdf-data.json metadata from Python')
-        return True
-    except Exception as e:
-        print(f"✗ Error updating pdf-data.json: {str(e)}")
-        return False
+def update_pdf_data_metadata(config, metadata):
+    """Update a pdf-data.json metadata dict in place; True if it changed"""
+    new_categories = [
+        {
+            "id": cat["id"],
+            "name": cat["name"],
+            "color": cat["color"]
+        }
+        for cat in config["categories"]
+    ]
+
+    changed = metadata.get('categories') != new_categories
+    metadata['categories'] = new_categories
+
+    # Ensure version is set
+    if 'version' not in metadata:
+        metadata['version'] = '2.0'
+        changed = True
+
+    return changed
 
 def generate_searches_file(config):
     """Generate a searches.md file from the categories configuration"""
     searches_file_path = get_project_root() / 'config' / 'searches.md'
     
     try:
-        # Generate the content
-        content = "# PDF Search Queries\n\n"
-        
+        # Generate the content as a list of lines and write them in one go,
+        # avoiding the quadratic cost of repeated string concatenation
+        parts = ["# PDF Search Queries\n\n"]
+
         for category in config["categories"]:
-            content += f"# {category['name']}\n"
-            
+            parts.append(f"# {category['name']}\n")
+
             # Add search queries for each keyword
-            for keyword in category["keywords"]:
-                content += f"{keyword} filetype:pdf\n"
-            
-            content += "\n"
-        
+            parts.extend(f"{keyword} filetype:pdf\n" for keyword in category["keywords"])
+
+            parts.append("\n")
+
         # Write the file
         with open(searches_file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+            f.writelines(parts)
+
         print('✓ Updated searches.md from Python')
         return True
     except Exception as e:
         print(f"✗ Error updating searches.md: {str(e)}")
         return False
 
-def update_categories_in_pdfs(config):
-    """Update category assignments in PDFs based on keywords"""
+def _categorize_pdf(pdf, config):
+    """Assign detected categories to a PDF that has none; True if it changed"""
+    # Skip PDFs that already have categories assigned
+    if pdf.get('categories') and len(pdf['categories']) > 0:
+        return False
+
+    # Look for keywords in title/description via the shared detector, which
+    # scans with the prebuilt Aho-Corasick automaton (or compiled pattern)
+    # from category_utils instead of one substring search per keyword
+    text = f"{pdf.get('title') or ''} {pdf.get('description') or ''}".strip()
+    if not text:
+        return False
+    matches = detect_categories(text)
+
+    # If we found categories, update the PDF
+    if matches:
+        pdf['categories'] = matches
+        return True
+    return False
+
+# Collections below this size are categorized serially; process startup and
+# IPC overhead outweigh the parallel speedup on small inputs
+PARALLEL_THRESHOLD = 5000
+
+def _categorize_pdf_worker(pdf):
+    """Process-pool worker: categorize one PDF, returning it with a flag."""
+    config = load_categories_config()
+    return pdf, _categorize_pdf(pdf, config)
+
+def _stream_update_categories(config, data_file_path, ijson):
+    """
+    Stream pdf-data.json through ijson, categorizing entry by entry
+
+    PDFs are read one at a time and written straight to a sibling temp file
+    that atomically replaces the original, so memory stays flat no matter
+    how large the collection grows. The metadata update is folded into the
+    same pass. The streamed output is compact rather than indented.
+    """
+    updated_count = 0
+
+    # Small top-level values are picked up in cheap extra passes; the pdfs
+    # array itself is never materialized as a whole
+    with open(data_file_path, 'rb') as f:
+        last_validated = next(ijson.items(f, 'lastValidated'), None)
+    with open(data_file_path, 'rb') as f:
+        metadata = next(ijson.items(f, 'metadata'), None)
+    metadata = metadata if metadata is not None else {}
+    update_pdf_data_metadata(config, metadata)
+
+    tmp_path = str(data_file_path) + '.tmp'
+    with open(data_file_path, 'rb') as src, open(tmp_path, 'wb') as out:
+        out.write(b'{')
+        if last_validated is not None:
+            out.write(b'"lastValidated": ' + json_dumps(last_validated, indent=False) + b', ')
+        out.write(b'"metadata": ' + json_dumps(metadata, indent=False) + b', ')
+        out.write(b'"pdfs": [')
+
+        for i, pdf in enumerate(ijson.items(src, 'pdfs.item', use_float=True)):
+            if _categorize_pdf(pdf, config):
+                updated_count += 1
+            if i:
+                out.write(b',')
+            out.write(json_dumps(pdf, indent=False))
+
+        out.write(b']}')
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(tmp_path, data_file_path)
+
+    return updated_count
+
+def update_categories_in_pdfs(config, pdf_data):
+    """Update category assignments in PDFs; returns the number changed"""
+    pdfs = pdf_data.get('pdfs', [])
+
+    # Process each PDF; large collections are fanned out over a
+    # process pool so keyword scans use every core, with each worker
+    # sending back its (possibly updated) entry
+    updated_count = 0
+    if len(pdfs) > PARALLEL_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_categorize_pdf_worker, pdfs, chunksize=64)
+            pdf_data['pdfs'] = []
+            for pdf, changed in results:
+                pdf_data['pdfs'].append(pdf)
+                if changed:
+                    updated_count += 1
+    else:
+        for pdf in pdfs:
+            if _categorize_pdf(pdf, config):
+                updated_count += 1
+
+    return updated_count
+
+def sync_pdf_data(config):
+    """
+    Apply the metadata and category updates to pdf-data.json
+
+    The file is parsed once and written once, instead of each update doing
+    its own full read/parse/serialize/write round trip. When ijson is
+    available the whole pass is streamed so memory stays flat.
+    """
     data_file_path = get_project_root() / 'public' / 'data' / 'pdf-data.json'
-    
+
     if not data_file_path.exists():
         print(f"✗ Error: pdf-data.json not found at {data_file_path}")
         return False
-    
+
     try:
-        # Read the data file
-        with open(data_file_path, 'r', encoding='utf-8') as f:
-            pdf_data = json.load(f)
-        
-        updated_count = 0
-        
-        # Process each PDF
-        for pdf in pdf_data['pdfs']:
-            # Skip PDFs that already have categories assigned
-            if pdf.get('categories') and len(pdf['categories']) > 0:
-                continue
-            
-            # Look for keywords in title and create a list of matching category IDs
-            text = f"{pdf.get('title', '')} {pdf.get('description', '')}"
-            matches = []
-            
-            for category in config["categories"]:
-                for keyword in category["keywords"]:
-                    if keyword.lower() in text.lower():
-                        if category["id"] not in matches:
-                            matches.append(category["id"])
-                        break
-            
-            # If we found categories, update the PDF
-            if matches:
-                pdf['categories'] = matches
-                updated_count += 1
-        
-        # Write the updated file if changes were made
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        if ijson is not None:
+            # Stream the file entry by entry to keep peak memory flat
+            updated_count = _stream_update_categories(config, data_file_path, ijson)
+            print('✓ Updated pdf-data.json metadata from Python')
+        else:
+            # Parse the data file once, straight out of a read-only memory
+            # map so the bytes come from the page cache instead of being
+            # copied onto the Python heap first. The stdlib json fallback
+            # can't consume a buffer, so re-read normally in that case.
+            with open(data_file_path, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            pdf_data = json_loads(view)
+                        finally:
+                            view.release()
+                except (TypeError, ValueError):
+                    f.seek(0)
+                    pdf_data = json_loads(f.read())
+
+            metadata_changed = update_pdf_data_metadata(
+                config, pdf_data.setdefault('metadata', {}))
+            updated_count = update_categories_in_pdfs(config, pdf_data)
+
+            # Write the updated file only if changes were made, going through
+            # a sibling temp file so a crash mid-write can't corrupt it
+            if metadata_changed or updated_count > 0:
+                tmp_path = str(data_file_path) + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(json_dumps(pdf_data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, data_file_path)
+
+            if metadata_changed:
+                print('✓ Updated pdf-data.json metadata from Python')
+            else:
+                print('✓ pdf-data.json metadata already up to date')
+
         if updated_count > 0:
-            with open(data_file_path, 'w', encoding='utf-8') as f:
-                json.dump(pdf_data, f, indent=2)
             print(f'✓ Updated categories for {updated_count} PDFs')
         else:
             print('✓ No PDFs needed category updates')
-        
+
         return True
     except Exception as e:
-        print(f"✗ Error updating PDF categories: {str(e)}")
+        print(f"✗ Error updating pdf-data.json: {str(e)}")
         return False
 
 def main():
@@ -149,14 +247,11 @@ def main():
     config = load_categories_config()
     print(f"Loaded {len(config['categories'])} categories from central configuration")
     
-    # Update PDF metadata section
-    update_pdf_data_metadata(config)
-    
     # Generate searches.md file
     generate_searches_file(config)
-    
-    # Update categories in PDFs
-    update_categories_in_pdfs(config)
+
+    # Update metadata and categories in pdf-data.json in a single pass
+    sync_pdf_data(config)
     
     print('\nSync completed!')
 
@@ -14,36 +14,59 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
-import random
 import sys
-import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
-# Import the PDF finder module
-try:
-    from pdf_finder import PDFFinder
-except ImportError:
-    # Try to find the module in the same directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    if os.path.exists(os.path.join(script_dir, 'pdf_finder.py')):
-        sys.path.append(script_dir)
+# Directory this script lives in, resolved once for the import fallbacks
+# and default path construction below
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Number of keyword searches kept in flight at once in --all mode; each one
+# spends most of its time waiting on the network
+QUERY_WORKERS = 4
+
+# Query terms that make useless tags: connectives and filetype specifiers
+_TAG_STOPWORDS = frozenset({'filetype:pdf', 'pdf', 'filetype', 'and', 'or', 'the', 'a', 'an'})
+
+def _import_pdf_finder():
+    """
+    Import the PDF finder module lazily
+
+    pdf_finder drags in the whole networking stack (requests, BeautifulSoup,
+    tqdm), so the import is deferred until a search is actually about to
+    run; --help and argument errors return without paying for it.
+    """
+    try:
         from pdf_finder import PDFFinder
-    else:
-        print("Error: Could not import pdf_finder.py. Make sure it's in the same directory.")
-        sys.exit(1)
+    except ImportError:
+        # Try to find the module in the same directory
+        if (SCRIPT_DIR / 'pdf_finder.py').exists():
+            sys.path.insert(0, str(SCRIPT_DIR))
+            from pdf_finder import PDFFinder
+        else:
+            print("Error: Could not import pdf_finder.py. Make sure it's in the same directory.")
+            sys.exit(1)
+    return PDFFinder
 
 # Import category utilities
 try:
-    from category_utils import load_categories_config, detect_categories, ensure_json_schema_compatibility
+    from category_utils import (load_categories_config, detect_categories,
+                                ensure_json_schema_compatibility,
+                                ensure_json_schema_compatibility_batch, json_dumps)
 except ImportError:
     # Try to find the module in the same directory
-    if os.path.exists(os.path.join(script_dir, 'category_utils.py')):
-        # Already added script_dir to path above
-        from category_utils import load_categories_config, detect_categories, ensure_json_schema_compatibility
+    if (SCRIPT_DIR / 'category_utils.py').exists():
+        sys.path.insert(0, str(SCRIPT_DIR))
+        from category_utils import (load_categories_config, detect_categories,
+                                    ensure_json_schema_compatibility,
+                                    ensure_json_schema_compatibility_batch, json_dumps)
     else:
         print("Warning: Could not import category_utils.py. Category detection will be limited.")
         # Define empty stubs for the functions
@@ -51,8 +74,13 @@ except ImportError:
             return {"categories": []}
         def detect_categories(text):
             return []
-        def ensure_json_schema_compatibility(pdf_entry):
+        def ensure_json_schema_compatibility(pdf_entry, today=None):
             return pdf_entry
+        def ensure_json_schema_compatibility_batch(pdf_entries, today=None):
+            return pdf_entries
+        def json_dumps(data, indent=True):
+            return json.dumps(data, indent=2 if indent else None,
+                              ensure_ascii=False).encode('utf-8')
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -124,15 +152,23 @@ def parse_arguments():
                 args.all = True
                 print("All categories mode selected")
             
-            args.limit = int(input(f"Maximum results per search [default: {args.limit}]: ").strip() or args.limit)
-            
+            # Keep the default on blank or non-numeric input instead of
+            # crashing with a traceback on a typo
+            raw_limit = input(f"Maximum results per search [default: {args.limit}]: ").strip()
+            if raw_limit:
+                try:
+                    args.limit = int(raw_limit)
+                except ValueError:
+                    print(f"Invalid number '{raw_limit}', keeping default: {args.limit}")
+
             # Ask for category if not using all mode
             if not args.all:
                 categories_config = load_categories_config()
-                print("\nAvailable categories:")
-                for i, category in enumerate(categories_config["categories"], 1):
-                    print(f"{i}. {category['name']} ({category['id']})")
-                
+                # Print the whole menu in one call rather than line by line
+                menu = "\n".join(f"{i}. {category['name']} ({category['id']})"
+                                 for i, category in enumerate(categories_config["categories"], 1))
+                print(f"\nAvailable categories:\n{menu}")
+
                 category_choice = input("\nSelect category number or leave empty for auto-categorization: ").strip()
                 if category_choice and category_choice.isdigit():
                     idx = int(category_choice) - 1
@@ -148,73 +184,82 @@ def parse_arguments():
 
 def get_default_paths(dev_mode=False):
     """Get default file paths based on environment."""
-    script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
-    
+    root_dir = SCRIPT_DIR.parent.parent
+
     if dev_mode:
         # Development environment
-        root_dir = script_dir.parent.parent
         existing_file = root_dir / 'dev' / 'data' / 'pdf-data.json'
-        output_file = existing_file
     else:
         # Production environment
-        root_dir = script_dir.parent.parent
         existing_file = root_dir / 'public' / 'data' / 'pdf-data.json'
-        output_file = existing_file
-    
+
+    output_file = existing_file
     return str(existing_file), str(output_file)
 
-def post_process_results(results, args):
-    """Post-process the results to ensure schema compatibility and categorization."""
-    categories_config = load_categories_config()
-    
-    for pdf in results:
-        # Assign category if specified
-        if args.category:
-            pdf['categories'] = [args.category]
-        
-        # Extract tags from sourceQuery before it gets removed in schema compatibility
-        if 'sourceQuery' in pdf:
-            # Initialize tags array if it doesn't exist
-            if 'tags' not in pdf or not pdf['tags']:
-                pdf['tags'] = []
-                
-            # Process sourceQuery to extract potential tags
-            if isinstance(pdf.get('sourceQuery'), list):
-                # Extract meaningful terms from the query as tags
-                for term in pdf['sourceQuery']:
-                    # Skip common terms, filetype specifiers, and any term containing 'filetype:pdf'
-                    if (term.lower() not in ['filetype:pdf', 'pdf', 'filetype', 'and', 'or', 'the', 'a', 'an'] 
-                            and 'filetype:' not in term.lower()
-                            and len(term) > 2 
-                            and term.lower() not in [t.lower() for t in pdf['tags']]):
-                        pdf['tags'].append(term.lower())
-            elif isinstance(pdf.get('sourceQuery'), str):
-                # Split the string into terms
-                terms = pdf['sourceQuery'].split()
-                for term in terms:
-                    if (term.lower() not in ['filetype:pdf', 'pdf', 'filetype', 'and', 'or', 'the', 'a', 'an']
-                            and 'filetype:' not in term.lower()
-                            and len(term) > 2 
-                            and term.lower() not in [t.lower() for t in pdf['tags']]):
-                        pdf['tags'].append(term.lower())
-            
-            # Remove sourceQuery field to ensure it's not included in final result
-            del pdf['sourceQuery']
-        
-        # Auto-categorize based on title and search query
-        if args.auto_categorize and not pdf.get('categories'):
-            # Create text to analyze from title only since sourceQuery might be deleted
-            analysis_text = pdf.get('title', '')
-            
-            # Detect categories
-            detected_categories = detect_categories(analysis_text)
-            if detected_categories:
-                pdf['categories'] = detected_categories
-        
-        # Ensure all entries conform to the standard schema
-        if args.standardize:
-            pdf = ensure_json_schema_compatibility(pdf)
-    
+@functools.lru_cache(maxsize=4096)
+def _detect_categories_cached(text):
+    """Memoized detect_categories; identical titles and queries repeat often."""
+    return tuple(detect_categories(text))
+
+def post_process_results(results, *, category=None, auto_categorize=True,
+                         standardize=True):
+    """
+    Post-process the results to ensure schema compatibility and categorization.
+
+    Takes the relevant options as explicit keyword arguments rather than a
+    whole argparse namespace, so hot callers (the --all keyword loop) don't
+    have to copy a Namespace per query just to override the category.
+    """
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    # Assign category if specified
+    if category:
+        for pdf in results:
+            pdf['categories'] = [category]
+
+    # Extract tags from sourceQuery before it gets removed in schema
+    # compatibility. Only entries that actually carry a sourceQuery enter
+    # this loop, so batches without queries skip the whole branch.
+    for pdf in (p for p in results if 'sourceQuery' in p):
+        # Initialize tags array if it doesn't exist
+        if 'tags' not in pdf or not pdf['tags']:
+            pdf['tags'] = []
+
+        # Process sourceQuery to extract potential tags. A list is used
+        # as-is, a string is split into terms; existing tags are tracked
+        # in a set so each candidate costs two O(1) lookups instead of
+        # re-lowercasing the whole tag list per term.
+        source_query = pdf['sourceQuery']
+        if isinstance(source_query, str):
+            source_query = source_query.split()
+        if isinstance(source_query, list):
+            seen_tags = {t.lower() for t in pdf['tags']}
+            for term in source_query:
+                term_lower = term.lower()
+                # Skip common terms, filetype specifiers, and duplicates
+                if (term_lower not in _TAG_STOPWORDS
+                        and 'filetype:' not in term_lower
+                        and len(term) > 2
+                        and term_lower not in seen_tags):
+                    pdf['tags'].append(term_lower)
+                    seen_tags.add(term_lower)
+
+        # Remove sourceQuery field to ensure it's not included in final result
+        del pdf['sourceQuery']
+
+    # Auto-categorize anything still uncategorized from its title (the only
+    # text guaranteed to survive the sourceQuery removal above)
+    if auto_categorize:
+        for pdf in results:
+            if not pdf.get('categories'):
+                detected_categories = list(_detect_categories_cached(pdf.get('title', '')))
+                if detected_categories:
+                    pdf['categories'] = detected_categories
+
+    # Ensure all entries conform to the standard schema in one batched pass
+    if standardize:
+        results = ensure_json_schema_compatibility_batch(results, today=today)
+
     return results
 
 def main():
@@ -254,11 +299,19 @@ def main():
         }
         
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(initial_data, f, indent=2)
+        # Serialize once and write through a sibling temp file that atomically
+        # replaces the output, matching how PDFFinder.save_results writes, so
+        # an interrupted bootstrap can't leave a truncated file behind
+        tmp_file = output_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(json_dumps(initial_data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, output_file)
         existing_file = output_file
     
-    # Initialize the PDF finder
+    # Initialize the PDF finder (imported here to keep startup fast)
+    PDFFinder = _import_pdf_finder()
     finder = PDFFinder(
         output_file=output_file,
         existing_file=existing_file,
@@ -280,69 +333,71 @@ def main():
         print(f"Maximum results per search: {args.limit}")
         print()
         
-        for category in categories_config["categories"]:
-            category_id = category["id"]
-            category_name = category["name"]
-            
-            print(f"Processing category: {category_name} ({category_id})")
-            
-            # Use the category keywords to construct search queries
-            all_category_results = []
-            
-            for keyword in category["keywords"]:
-                # Skip very short keywords
-                if len(keyword) < 3:
-                    continue
-                    
-                query = f"{keyword} filetype:pdf"
-                print(f"  Searching for: {query}")
-                
-                # Perform the search with current category
-                temp_args = argparse.Namespace(**vars(args))
-                temp_args.query = query
-                temp_args.category = category_id
-                
-                # Search using current query
-                results = finder.search_and_process(
-                    query=query,
-                    limit=args.limit,
-                    search_methods=search_methods,
-                    verify=not args.no_verify
-                )
-                
-                # Post-process results for this category
-                processed_results = post_process_results(results, temp_args)
-                all_category_results.extend(processed_results)
-                total_results.extend(processed_results)
-                
-                # Longer delay between queries — 1s gets both Google and DuckDuckGo
-                # rate-limiting after ~4 categories (~20 searches)
-                time.sleep(random.uniform(10, 15))
-            
-            print(f"  Added {len(all_category_results)} PDFs to category: {category_name}")
-            print()
+        # Defer the finder's per-query saves: entries are journaled as they
+        # validate, and the aggregated file is rewritten once at the end
+        # instead of once per keyword
+        with finder.defer_saves():
+            for category in categories_config["categories"]:
+                category_id = category["id"]
+                category_name = category["name"]
+
+                print(f"Processing category: {category_name} ({category_id})")
+
+                # Use the category keywords to construct search queries,
+                # skipping very short keywords
+                queries = [f"{keyword} filetype:pdf" for keyword in category["keywords"]
+                           if len(keyword) >= 3]
+
+                # Each query is dominated by network latency, so fan them out
+                # over a small thread pool instead of running them back to back.
+                # QUERY_WORKERS bounds how many searches are in flight at once,
+                # and PDFFinder serializes its shared collection state internally.
+                all_category_results = []
+                with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as executor:
+                    future_to_query = {
+                        executor.submit(
+                            finder.search_and_process,
+                            query=query,
+                            limit=args.limit,
+                            search_methods=search_methods,
+                            verify=not args.no_verify
+                        ): query
+                        for query in queries
+                    }
+                    for future in as_completed(future_to_query):
+                        print(f"  Searched for: {future_to_query[future]}")
+                        processed_results = post_process_results(
+                            future.result(),
+                            category=category_id,
+                            auto_categorize=args.auto_categorize,
+                            standardize=args.standardize
+                        )
+                        all_category_results.extend(processed_results)
+                        total_results.extend(processed_results)
+
+                print(f"  Added {len(all_category_results)} PDFs to category: {category_name}")
+                print()
         
-        # Update all results in the data file
-        if total_results:
-            finder.save_results()
-            
         # Print overall results summary
         print(f"All Categories Update Completed:")
         print(f"- {len(total_results)} new PDFs added")
         print(f"- Collection now contains {len(finder.data['pdfs'])} PDFs total")
         print(f"- Updated collection saved to {output_file}")
         
-        # Print category statistics
-        print(f"\nCategory statistics:")
-        category_counts = {}
+        # Category statistics; Counter.update does the tallying in C, and
+        # uncategorized entries (missing or empty list) count as one
+        # "uncategorized" each
+        category_counts = Counter()
         for pdf in finder.data["pdfs"]:
-            for cat in pdf.get("categories", ["uncategorized"]):
-                category_counts[cat] = category_counts.get(cat, 0) + 1
-        
-        for cat_id, count in category_counts.items():
-            # Try to get the actual category name
-            cat_name = next((c["name"] for c in categories_config["categories"] if c["id"] == cat_id), cat_id)
-            print(f"- {cat_name}: {count} PDFs")
+            category_counts.update(pdf.get("categories") or ("uncategorized",))
+
+        # Map category IDs to display names once instead of scanning the
+        # config per category, then emit the whole report (largest category
+        # first) as a single write rather than one print per line
+        id_to_name = {c["id"]: c["name"] for c in categories_config["categories"]}
+        report = "\n".join(f"- {id_to_name.get(cat_id, cat_id)}: {count} PDFs"
+                           for cat_id, count in category_counts.most_common())
+        sys.stdout.write(f"\nCategory statistics:\n{report}\n")
         
     else:
         # Use appropriate search method based on arguments
@@ -365,7 +420,12 @@ def main():
         )
         
         # Post-process results for schema compatibility and categorization
-        results = post_process_results(results, args)
+        results = post_process_results(
+            results,
+            category=args.category,
+            auto_categorize=args.auto_categorize,
+            standardize=args.standardize
+        )
         
         # Update the results in the data file
         if results: